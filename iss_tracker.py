@@ -1,23 +1,42 @@
-from flask import Flask, request
+from flask import Flask, Response, request, stream_with_context
 import requests
-import xmltodict
+import urllib3
+from xml.etree import ElementTree
 import numpy as np
 import logging
 import time
+import calendar
+from math import hypot
 import redis
-import json
+import socket
+import threading
+import orjson
 from geopy.geocoders import Nominatim
-from astropy import coordinates, units
-from astropy.time import Time
+import erfa
+
+# Upper bound on pooled Redis connections per worker process; requests
+# block for a free connection instead of opening unbounded sockets
+DATABASE_MAX_CONNECTIONS = 64
 
 # Redis connection with retry mechanism
 def establish_database_connection():
     max_attempts = 5
     wait_time = 2
+
+    # Probe idle sockets after a minute so dead connections are noticed early
+    keepalive_options = {}
+    if hasattr(socket, 'TCP_KEEPIDLE'):
+        keepalive_options[socket.TCP_KEEPIDLE] = 60
+
+    pool = redis.BlockingConnectionPool(host='redis-db', port=6379, db=0,
+                                        max_connections=DATABASE_MAX_CONNECTIONS,
+                                        socket_keepalive=True,
+                                        socket_keepalive_options=keepalive_options,
+                                        health_check_interval=30)
     
     for attempt in range(max_attempts):
         try:
-            db_client = redis.Redis(host='redis-db', port=6379, db=0)
+            db_client = redis.Redis(connection_pool=pool)
             db_client.ping()  # Verify connection
             return db_client
         except redis.exceptions.ConnectionError as e:
@@ -31,49 +50,452 @@ def establish_database_connection():
 # Initialize database connection
 database = establish_database_connection()
 
+# Prefix for each epoch's JSON state vector, kept apart from the index and caches
+EPOCH_KEY_PREFIX = 'epoch:'
+
+# Sorted set indexing every epoch by its unix timestamp. Ingest builds the
+# index under a staging key and renames it into place once it is complete.
+EPOCH_INDEX_KEY = 'iss:epochs'
+EPOCH_INDEX_STAGING_KEY = 'iss:epochs:staging'
+
+# In-process copy of the time index, refreshed from Redis every few minutes
+EPOCH_INDEX_TTL = 300
+EPOCH_INDEX = []
+EPOCH_SCORES = np.empty(0, dtype=np.float64)
+epoch_index_loaded_at = 0.0
+
+# Layout version of the stored data; bump when the keys written at ingest change
+# so that data left in Redis by an older release is re-ingested on startup
+DATA_FORMAT_KEY = 'iss:format_version'
+DATA_FORMAT_VERSION = 2
+
+# Bare YYYY-DDDT... keys holding state vectors in layouts before version 2
+LEGACY_EPOCH_KEY_PATTERN = '[0-9][0-9][0-9][0-9]-[0-9][0-9][0-9]T*'
+
+# Prefix for hashes holding each epoch's numeric state vector fields
+STATE_VECTOR_KEY_PREFIX = 'sv:'
+STATE_VECTOR_FIELDS = ('X', 'Y', 'Z', 'X_DOT', 'Y_DOT', 'Z_DOT')
+
+# Prefix for cached (lat, lon, alt) triples, keyed by epoch
+LOCATION_KEY_PREFIX = 'loc:'
+
+# Reverse-geocoded addresses, bucketed to 0.01 degrees and kept for a day
+GEOLOC_KEY_PREFIX = 'geo:'
+GEOLOC_TTL = 86400
+
+# Shared geocoder so its HTTP session is reused across requests
+#taken from hint posted
+GEOCODER = Nominatim(user_agent='iss_tracker', timeout=5)
+
 # Initialize application
 station_tracker = Flask(__name__)
 
+# Lock held while one process performs the ingest; after a failed attempt it is
+# left to expire, which spaces out retries by INGEST_LOCK_TTL seconds
+INGEST_LOCK_KEY = 'iss:ingest_lock'
+INGEST_LOCK_TTL = 300
+
+# Seconds between background checks while another process holds the ingest
+# lock or a failed attempt's lock has not yet expired
+INGEST_RETRY_INTERVAL = 30
+
+# Number of state vectors parsed before their writes are flushed to Redis
+INGEST_BATCH_SIZE = 500
+
+# (connect, read) timeouts in seconds for the NASA download, so a stalled
+# stream fails the ingest instead of blocking it forever
+INGEST_TIMEOUT = (10, 60)
+
 def fetch_orbital_data():
     """
     Retrieve and store orbital data from NASA's public repository
     """
     source_url = "https://nasa-public-data.s3.amazonaws.com/iss-coords/current/ISS_OEM/ISS.OEM_J2K_EPH.xml"
-    response = requests.get(source_url)
-    
-    if not response.text or response.status_code != 200:
+
+    # Stream the XML and store state vectors in batches as they are parsed. The
+    # epochs are indexed under a staging key, so a failed or partial download
+    # never replaces the live index.
+    database.delete(EPOCH_INDEX_STAGING_KEY)
+    stored = 0
+    try:
+        with requests.get(source_url, stream=True, timeout=INGEST_TIMEOUT) as response:
+            if response.status_code != 200:
+                logging.error('Failed to retrieve orbital data')
+                return False
+
+            response.raw.decode_content = True
+            batch = []
+            # track the open elements so each parsed vector can be detached from
+            # its parent; otherwise the tree keeps every (cleared) vector alive
+            open_elements = []
+            for event, element in ElementTree.iterparse(response.raw, events=('start', 'end')):
+                if event == 'start':
+                    open_elements.append(element)
+                    continue
+                open_elements.pop()
+                if element.tag != 'stateVector':
+                    continue
+                batch.append(state_vector_from_element(element))
+                open_elements[-1].remove(element)
+                if len(batch) >= INGEST_BATCH_SIZE:
+                    store_orbital_vectors(batch, EPOCH_INDEX_STAGING_KEY)
+                    stored += len(batch)
+                    batch = []
+            if batch:
+                store_orbital_vectors(batch, EPOCH_INDEX_STAGING_KEY)
+                stored += len(batch)
+    # reading response.raw directly surfaces urllib3's own errors (dropped
+    # connection, read timeout, bad gzip) rather than requests' wrappers
+    except (requests.RequestException, urllib3.exceptions.HTTPError,
+            ElementTree.ParseError, ValueError) as e:
+        logging.error(f'Failed to retrieve orbital data: {e}')
+        database.delete(EPOCH_INDEX_STAGING_KEY)
+        return False
+
+    if not stored:
         logging.error('Failed to retrieve orbital data')
         return False
-        
-    parsed_data = xmltodict.parse(response.text)
-    orbital_vectors = parsed_data['ndm']['oem']['body']['segment']['data']['stateVector']
-    
-    # Store each vector in database
-    for vector in orbital_vectors:
-        timestamp = vector['EPOCH']
-        database.set(timestamp, json.dumps(vector))
-    
+
+    # Note what the live data holds before it is replaced
+    previous_version = database.get(DATA_FORMAT_KEY)
+    previous_epochs = {epoch.decode() for epoch in database.zrange(EPOCH_INDEX_KEY, 0, -1)}
+    current_epochs = {epoch.decode() for epoch in database.zrange(EPOCH_INDEX_STAGING_KEY, 0, -1)}
+
+    # Publish the complete index and its format version together
+    pipe = database.pipeline(transaction=True)
+    pipe.rename(EPOCH_INDEX_STAGING_KEY, EPOCH_INDEX_KEY)
+    pipe.set(DATA_FORMAT_KEY, DATA_FORMAT_VERSION)
+    pipe.execute()
+
+    # Drop the keys of epochs that are no longer published, and any state
+    # vectors left under bare epoch keys by an older data layout
+    remove_epoch_keys(previous_epochs - current_epochs)
+    if previous_version is None or int(previous_version) != DATA_FORMAT_VERSION:
+        remove_legacy_epoch_keys()
+
+    refresh_epoch_index(force=True)
     return True
 
-def calculate_earth_coordinates(vector):
+def remove_epoch_keys(epochs):
+    """
+    Delete the stored state vector, hash and cached location of each epoch
+
+    Args: epochs (Iterable[str]): epochs to remove
+
+    Returns: None
+    """
+    epochs = list(epochs)
+    for start in range(0, len(epochs), INGEST_BATCH_SIZE):
+        keys = []
+        for epoch in epochs[start:start + INGEST_BATCH_SIZE]:
+            keys += [f'{EPOCH_KEY_PREFIX}{epoch}', f'{STATE_VECTOR_KEY_PREFIX}{epoch}',
+                     f'{LOCATION_KEY_PREFIX}{epoch}']
+        database.delete(*keys)
+
+def remove_legacy_epoch_keys():
+    """
+    Delete state vectors stored under bare epoch keys, as layouts before
+    DATA_FORMAT_VERSION 2 did
+
+    Args: None
+
+    Returns: None
+    """
+    keys = []
+    for key in database.scan_iter(match=LEGACY_EPOCH_KEY_PATTERN, count=1000):
+        keys.append(key)
+        if len(keys) >= INGEST_BATCH_SIZE:
+            database.delete(*keys)
+            keys = []
+    if keys:
+        database.delete(*keys)
+
+def ensure_orbital_data():
+    """
+    Ingest the orbital data unless Redis already holds a complete, current copy
+
+    Only the process that takes INGEST_LOCK_KEY downloads the data. If the
+    ingest fails or raises, the lock is left to expire so the next attempt
+    waits INGEST_LOCK_TTL seconds.
+
+    Args: None
+
+    Returns: bool: True if current data is available
+    """
+    try:
+        if orbital_data_current():
+            return True
+        if not database.set(INGEST_LOCK_KEY, '1', nx=True, ex=INGEST_LOCK_TTL):
+            return False
+
+        if fetch_orbital_data():
+            database.delete(INGEST_LOCK_KEY)
+            return True
+    except Exception:
+        logging.exception('Failed to ingest orbital data')
+    return False
+
+def retry_orbital_data_ingest():
+    """
+    Call ensure_orbital_data every INGEST_RETRY_INTERVAL seconds until current data is available
+
+    Args: None
+
+    Returns: None
+    """
+    while not ensure_orbital_data():
+        time.sleep(INGEST_RETRY_INTERVAL)
+
+def orbital_data_current():
+    """
+    Check whether Redis holds a complete ingest in the current data layout
+
+    Args: None
+
+    Returns: bool: True if the index exists and was written by this format version
+    """
+    version = database.get(DATA_FORMAT_KEY)
+    return (version is not None and int(version) == DATA_FORMAT_VERSION
+            and bool(database.exists(EPOCH_INDEX_KEY)))
+
+def state_vector_from_element(element):
+    """
+    Convert a <stateVector> element to the dict shape stored in Redis
+
+    Args: element (Element): parsed <stateVector> element
+
+    Returns: dict mapping each child tag to its text, or to {'@attr': ..., '#text': ...}
+             when the child carries attributes (e.g. units)
+    """
+    vector = {}
+    for child in element:
+        if child.attrib:
+            value = {f'@{name}': attr for name, attr in child.attrib.items()}
+            value['#text'] = child.text
+            vector[child.tag] = value
+        else:
+            vector[child.tag] = child.text
+    return vector
+
+def store_orbital_vectors(orbital_vectors, index_key):
+    """
+    Store a batch of state vectors, index them by time and cache their locations
+
+    Args: orbital_vectors (List[dict]): state vectors to write, in one pipeline
+          index_key (str): sorted set to add the epochs to
+
+    Returns: None
+    """
+    pipe = database.pipeline(transaction=False)
+    positions = []
+    scores = epoch_timestamps([vector['EPOCH'] for vector in orbital_vectors])
+    for vector, score in zip(orbital_vectors, scores):
+        timestamp = vector['EPOCH']
+        pipe.set(f'{EPOCH_KEY_PREFIX}{timestamp}', orjson.dumps(vector))
+        pipe.hset(f'{STATE_VECTOR_KEY_PREFIX}{timestamp}',
+                  mapping={field: vector[field]['#text'] for field in STATE_VECTOR_FIELDS})
+        positions.append([float(vector['X']['#text']), float(vector['Y']['#text']), float(vector['Z']['#text'])])
+    pipe.zadd(index_key, {vector['EPOCH']: int(score) for vector, score in zip(orbital_vectors, scores)})
+
+    # Precompute the Earth-based location of every epoch in one transform
+    lats, lons, alts = calculate_earth_coordinates_bulk(positions, scores)
+    for vector, lat, lon, alt in zip(orbital_vectors, lats, lons, alts):
+        pipe.set(f"{LOCATION_KEY_PREFIX}{vector['EPOCH']}",
+                 orjson.dumps([float(lat), float(lon), float(alt)]))
+    pipe.execute()
+
+def epoch_timestamp(epoch):
+    """
+    Convert an epoch string to a unix timestamp
+
+    Args: epoch (str): epoch in YYYY-DDDTHH:MM:SS.sssZ form (UTC)
+
+    Returns: timestamp (int): seconds since 1970-01-01 UTC
+    """
+    # timegm, not mktime: the epoch is already UTC and must not be shifted
+    # by the local timezone or DST
+    return calendar.timegm(time.strptime(epoch[:-5], '%Y-%jT%H:%M:%S'))
+
+# Character layout of an epoch string; 'd' marks a digit
+EPOCH_FORMAT = 'dddd-dddTdd:dd:dd.dddZ'
+
+def epoch_timestamps(epochs):
+    """
+    Vectorized epoch_timestamp for a batch of epoch strings
+
+    Args: epochs (List[str]): epochs in YYYY-DDDTHH:MM:SS.sssZ form (UTC)
+
+    Returns: timestamps (np.ndarray): int64 seconds since 1970-01-01 UTC
+
+    Raises: ValueError if any epoch does not have that exact layout or a field
+            is out of range
+    """
+    text = np.asarray(epochs, dtype=str).reshape(-1)
+    if not len(text):
+        return np.empty(0, dtype=np.int64)
+
+    # View the fixed-width strings as a character grid and read the digits
+    # column-wise, so the whole batch is parsed without per-row strptime
+    width = len(EPOCH_FORMAT)
+    valid = np.char.str_len(text) == width
+    chars = text.astype(f'U{width}').view('U1').reshape(len(text), width)
+    for column, expected in enumerate(EPOCH_FORMAT):
+        if expected == 'd':
+            valid &= np.char.isdigit(chars[:, column])
+        else:
+            valid &= chars[:, column] == expected
+    if not valid.all():
+        raise_malformed_epoch(text, valid)
+
+    def field(start, stop):
+        digits = chars[:, start:stop].astype(np.int64)
+        return digits @ (10 ** np.arange(stop - start - 1, -1, -1, dtype=np.int64))
+
+    year, day = field(0, 4), field(5, 8)
+    hour, minute, second = field(9, 11), field(12, 14), field(15, 17)
+
+    # Same ranges strptime enforces: day within the year, seconds up to a leap second
+    leap_year = ((year % 4 == 0) & (year % 100 != 0)) | (year % 400 == 0)
+    valid = ((day >= 1) & (day <= 365 + leap_year)
+             & (hour < 24) & (minute < 60) & (second < 61))
+    if not valid.all():
+        raise_malformed_epoch(text, valid)
+
+    year_start = (year - 1970).astype('datetime64[Y]').astype('datetime64[s]').astype(np.int64)
+    return year_start + (day - 1) * 86400 + hour * 3600 + minute * 60 + second
+
+def raise_malformed_epoch(epochs, valid):
+    """
+    Raise a ValueError naming the first epoch that failed validation
+
+    Args: epochs (np.ndarray): epoch strings
+          valid (np.ndarray): boolean mask, False for malformed epochs
+
+    Returns: None
+    """
+    bad = str(epochs[np.argmin(valid)])
+    raise ValueError(f"Malformed epoch {bad!r}, expected YYYY-DDDTHH:MM:SS.sssZ")
+
+def refresh_epoch_index(force=False):
+    """
+    Reload the cached epoch list and timestamps from the Redis time index
+
+    Args: force (bool): reload even if the cached copy has not expired
+
+    Returns: None
+    """
+    global EPOCH_INDEX, EPOCH_SCORES, epoch_index_loaded_at
+
+    if not force and EPOCH_INDEX and time.time() - epoch_index_loaded_at < EPOCH_INDEX_TTL:
+        return
+
+    entries = database.zrange(EPOCH_INDEX_KEY, 0, -1, withscores=True)
+    EPOCH_INDEX = [epoch.decode() for epoch, _ in entries]
+    EPOCH_SCORES = np.fromiter((score for _, score in entries), dtype=np.float64,
+                               count=len(entries))
+    epoch_index_loaded_at = time.time()
+
+def calculate_earth_coordinates_bulk(positions, timestamps):
+    """
+    Rotate GCRS positions into the ITRS frame and convert to lat/long/alt with ERFA
+
+    Args: positions (np.ndarray): (N, 3) GCRS positions in km
+          timestamps (np.ndarray): N unix timestamps (UTC seconds)
+
+    Returns: lat, lon (degrees) and alt (km) arrays in the same order as positions
+    """
+    # Two-part UTC Julian dates, then TT for the precession/nutation model
+    days = np.asarray(timestamps, dtype=np.float64) / 86400.0
+    utc1 = 2440587.5 + np.floor(days)
+    utc2 = days - np.floor(days)
+    tai1, tai2 = erfa.utctai(utc1, utc2)
+    tt1, tt2 = erfa.taitt(tai1, tai2)
+
+    # Celestial-to-terrestrial matrix, approximating UT1 by UTC and ignoring polar motion
+    rc2t = erfa.c2t00b(tt1, tt2, utc1, utc2, 0.0, 0.0)
+    itrs = np.einsum('...ij,...j->...i', rc2t, np.asarray(positions, dtype=np.float64))
+
+    # WGS84 geodetic coordinates (ERFA works in metres and radians)
+    lon, lat, height = erfa.gc2gd(1, itrs * 1000.0)
+    return np.degrees(lat), np.degrees(lon), height / 1000.0
+
+def calculate_earth_coordinates(epoch, position):
     """
     Transform space coordinates to Earth-based lat/long/alt
+
+    Args: epoch (str): epoch of the position
+          position (List[float]): GCRS X, Y, Z in km
+
+    Returns: (lat, lon, alt) tuple
     """
-    x_pos = float(vector['X']['#text'])
-    y_pos = float(vector['Y']['#text'])
-    z_pos = float(vector['Z']['#text'])
-    
-    # Format timestamp for astropy
-    formatted_time = time.strftime('%Y-%m-%d %H:%M:%S', 
-                                  time.strptime(vector['EPOCH'][:-5], '%Y-%jT%H:%M:%S'))
-    
-    # Use astropy to calculate Earth-relative position
-    cart_coords = coordinates.CartesianRepresentation([x_pos, y_pos, z_pos], unit=units.km)
-    space_ref = coordinates.GCRS(cart_coords, obstime=formatted_time)
-    earth_ref = space_ref.transform_to(coordinates.ITRS(obstime=formatted_time))
-    position = coordinates.EarthLocation(*earth_ref.cartesian.xyz)
-    
-    return position.lat.value, position.lon.value, position.height.value
+    lat, lon, alt = calculate_earth_coordinates_bulk([position], [epoch_timestamp(epoch)])
+    return float(lat[0]), float(lon[0]), float(alt[0])
+
+def cached_earth_coordinates(epoch):
+    """
+    Earth-based lat/long/alt for an epoch, computed once and cached in Redis
+
+    Args: epoch (str): epoch whose state vector is stored in Redis
+
+    Returns: (lat, lon, alt) tuple, or None if the epoch does not exist
+    """
+    location_key = f'{LOCATION_KEY_PREFIX}{epoch}'
+    cached = database.get(location_key)
+    if cached:
+        return tuple(orjson.loads(cached))
+
+    position = database.hmget(f'{STATE_VECTOR_KEY_PREFIX}{epoch}', 'X', 'Y', 'Z')
+    if None in position:
+        return None
+
+    lat, lon, alt = calculate_earth_coordinates(epoch, [float(value) for value in position])
+    database.set(location_key, orjson.dumps([lat, lon, alt]))
+    return lat, lon, alt
+
+def load_state_vectors(epochs):
+    """
+    Fetch the serialized state vectors for several epochs with one MGET
+
+    Args: epochs (List[str]): epochs to look up
+
+    Returns: List of JSON-encoded state vectors (bytes), None where an epoch is missing
+    """
+    if not epochs:
+        return []
+    return database.mget([f'{EPOCH_KEY_PREFIX}{epoch}' for epoch in epochs])
+
+def reverse_geocode(lat, lon):
+    """
+    Look up the address below a lat/long, cached in Redis per 0.01 degree cell
+
+    Args: lat (float), lon (float): position in degrees
+
+    Returns: address (str), or "Unknown location" when there is none
+    """
+    geoloc_key = f'{GEOLOC_KEY_PREFIX}{lat:.2f}:{lon:.2f}'
+    cached = database.get(geoloc_key)
+    if cached:
+        return cached.decode()
+
+    geoloc = GEOCODER.reverse((lat, lon), zoom=15, language='en')
+    address = geoloc.address if geoloc else "Unknown location"
+
+    database.setex(geoloc_key, GEOLOC_TTL, address)
+    return address
+
+def json_response(payload, status=200):
+    """
+    Serialize a payload with orjson into a Flask response
+
+    Args: payload: JSON-serializable object
+          status (int): HTTP status code
+
+    Returns: Response with an application/json body
+    """
+    return Response(orjson.dumps(payload), status=status, mimetype='application/json')
+
+# Number of state vectors fetched per MGET while streaming /epochs
+EPOCHS_CHUNK_SIZE = 500
 
 # Original route: returns entire list of epochs
 @station_tracker.route('/epochs', methods=['GET'])
@@ -88,26 +510,28 @@ def get_epochs():
     limit = request.args.get('limit', default=None, type=int)
     offset = request.args.get('offset', default=0, type=int)
 
-    # get all keys (epochs) from Redis
-    epochs = database.keys()
-    epochs = [epoch.decode() for epoch in epochs]
-
-    # Apply limit and offset
+    # get the requested slice of epochs from the cached time index
+    refresh_epoch_index()
     if limit is not None:
-        epochs = epochs[offset:offset + limit]
+        epochs = EPOCH_INDEX[offset:offset + limit]
     else:
-        epochs = epochs[offset:]
-
-    # get state vectors for each epoch
-    result = []
-    for epoch in epochs:
-        state_vector = json.loads(database.get(epoch))
-        result.append({
-            "epoch": epoch,
-            "state_vector": state_vector
-        })
-
-    return result
+        epochs = EPOCH_INDEX[offset:]
+
+    # stream the array, fetching state vectors one MGET per chunk and splicing
+    # the stored JSON straight into the response instead of re-encoding it
+    def generate():
+        yield b'['
+        separator = b''
+        for start in range(0, len(epochs), EPOCHS_CHUNK_SIZE):
+            chunk = epochs[start:start + EPOCHS_CHUNK_SIZE]
+            for epoch, state_vector in zip(chunk, load_state_vectors(chunk)):
+                if state_vector is None:
+                    continue
+                yield separator + b'{"epoch":' + orjson.dumps(epoch) + b',"state_vector":' + state_vector + b'}'
+                separator = b','
+        yield b']'
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
 
 # Original route: returns state vectors for epoch
 @station_tracker.route('/epochs/<epoch>', methods=['GET'])
@@ -119,12 +543,12 @@ def get_epoch(epoch):
 
     Returns: data (List[dict]) dictionary value of that specified epoch
     """
-    if not database.exists(epoch):
-        return {"error": "Epoch not found"}, 404
+    raw = database.get(f'{EPOCH_KEY_PREFIX}{epoch}')
+    if raw is None:
+        return json_response({"error": "Epoch not found"}, 404)
 
-    # retrieve the state vector from Redis and deserialize it
-    state_vector = json.loads(database.get(epoch))
-    return state_vector
+    # return the stored JSON as-is
+    return Response(raw, mimetype='application/json')
 
 # Original route: returns specific epoch speed
 @station_tracker.route('/epochs/<epoch>/speed', methods=['GET'])
@@ -136,17 +560,14 @@ def get_epoch_speed(epoch):
 
     Returns: speed (int) calculated speed of specified epoch using the X Y and Z dots
     """
-    if not database.exists(epoch):
-        return {"error": "Epoch not found"}, 404
-
-    # retrieve the state vector from Redis and deserialize it
-    state_vector = json.loads(database.get(epoch))
+    # only the velocity fields are needed, so skip the full state vector
+    velocity = database.hmget(f'{STATE_VECTOR_KEY_PREFIX}{epoch}', 'X_DOT', 'Y_DOT', 'Z_DOT')
+    if None in velocity:
+        return json_response({"error": "Epoch not found"}, 404)
 
-    X = float(state_vector['X_DOT']['#text'])
-    Y = float(state_vector['Y_DOT']['#text'])
-    Z = float(state_vector['Z_DOT']['#text'])
-    speed = np.sqrt(np.square(X) + np.square(Y) + np.square(Z))
-    return {"speed": speed}
+    X, Y, Z = map(float, velocity)
+    speed = hypot(X, Y, Z)
+    return json_response({"speed": speed})
 
 # Original route: returns closest epoch to 'now'
 @station_tracker.route('/now', methods=['GET'])
@@ -158,40 +579,30 @@ def get_now():
 
     Returns: closest_data (List[dict]): state vectors of epoch with time closest to 'now'
     """
-    current_time = time.mktime(time.gmtime())
+    current_time = time.time()
     closest_epoch = None
-    closest_diff = float('inf')
 
-    # searches all keys in Redis
-    for epoch in database.keys():
-        epoch = epoch.decode()
-        epoch_str = epoch.split('.')[0]
-        epoch_time = time.mktime(time.strptime(epoch_str, '%Y-%jT%H:%M:%S'))
-        time_diff = np.abs(current_time - epoch_time)
+    # binary search the cached timestamps for the epochs either side of 'now'
+    refresh_epoch_index()
+    if len(EPOCH_SCORES):
+        position = np.searchsorted(EPOCH_SCORES, current_time)
+        candidates = np.clip([position - 1, position], 0, len(EPOCH_SCORES) - 1)
+        closest = candidates[np.argmin(np.abs(EPOCH_SCORES[candidates] - current_time))]
+        closest_epoch = EPOCH_INDEX[closest]
 
-        if time_diff < closest_diff:
-            closest_diff = time_diff
-            closest_epoch = epoch
+    coords = cached_earth_coordinates(closest_epoch) if closest_epoch else None
+    if coords:
+        lat, lon, alt = coords
 
-    if closest_epoch:
-       
-        state_vector = json.loads(database.get(closest_epoch))
-
-        lat, lon, alt = calculate_earth_coordinates(state_vector)
-
-        #taken from hint posted
-        geocoder = Nominatim(user_agent='iss_tracker')
-        geoloc = geocoder.reverse((lat, lon), zoom=15, language='en')
-
-        return {
+        return json_response({
             "lat": lat,
             "lon": lon,
             "alt": alt,
-            "geoloc": geoloc.address if geoloc else "Unknown location",
+            "geoloc": reverse_geocode(lat, lon),
             "epoch_timestamp": closest_epoch,
             "now_timestamp": time.strftime('%m/%d/%Y, %H:%M:%S', time.gmtime())
-        }
-    return {"error": "No data available"}, 404
+        })
+    return json_response({"error": "No data available"}, 404)
 
 # Original route: Returns location for a specific epoch
 @station_tracker.route('/epochs/<epoch>/location', methods=['GET'])
@@ -203,28 +614,29 @@ def get_epoch_location(epoch):
 
     Returns: dict: Contains latitude, longitude, altitude, and geoposition.
     """
-    if not database.exists(epoch):
-        return {"error": "Epoch not found"}, 404
+    # a single lookup: cached coordinates, or the state vector on a miss
+    coords = cached_earth_coordinates(epoch)
+    if coords is None:
+        return json_response({"error": "Epoch not found"}, 404)
 
-    # retrieve the state vector from Redis and deserialize it
-    state_vector = json.loads(database.get(epoch))
+    lat, lon, alt = coords
 
-    lat, lon, alt = calculate_earth_coordinates(state_vector)
-
-    geocoder = Nominatim(user_agent='iss_tracker')
-    geoloc = geocoder.reverse((lat, lon), zoom=15, language='en')
-
-    return {
+    return json_response({
         "lat": lat,
         "lon": lon,
         "alt": alt,
-        "geoloc": geoloc.address if geoloc else "Unknown location",
+        "geoloc": reverse_geocode(lat, lon),
         "epoch_timestamp": epoch
-    }
-
-# Initialize data on startup if database is empty
-if not database.keys():
-    fetch_orbital_data()
+    })
+
+# Initialize data on startup if database is empty or out of date. Every Gunicorn
+# worker imports this module, but only the one holding the ingest lock downloads
+# the data; the index is published in one step once that ingest has finished,
+# and workers keep reloading their empty in-process index until it appears.
+# If the data is not available yet, keep retrying in the background so a failed
+# ingest is picked up again without doing it inside a request.
+if not ensure_orbital_data():
+    threading.Thread(target=retry_orbital_data_ingest, daemon=True).start()
 
 def main():
     fetch_orbital_data()
@@ -1,7 +1,52 @@
 import pytest
-import numpy as np
-from iss_tracker import station_tracker, fetch_orbital_data, database
+from math import hypot
+import iss_tracker
+from iss_tracker import station_tracker, fetch_orbital_data, database, epoch_timestamp, epoch_timestamps
+from iss_tracker import calculate_earth_coordinates, EPOCH_INDEX_KEY, EPOCH_INDEX_STAGING_KEY, DATA_FORMAT_KEY
+from iss_tracker import ensure_orbital_data, retry_orbital_data_ingest, INGEST_LOCK_KEY
 import redis
+import urllib3
+
+# Start of an OEM document, cut off partway through the second state vector
+TRUNCATED_OEM = b"""<?xml version="1.0" encoding="UTF-8"?>
+<ndm><oem><body><segment><data>
+<stateVector><EPOCH>2025-061T12:00:00.000Z</EPOCH>
+<X units="km">-4000.0</X><Y units="km">3000.0</Y><Z units="km">4500.0</Z>
+<X_DOT units="km/s">1.0</X_DOT><Y_DOT units="km/s">2.0</Y_DOT><Z_DOT units="km/s">3.0</Z_DOT>
+</stateVector>
+<stateVector><EPOCH>2025-061T12:04:00.000Z</EPOCH>
+<X units="km">-39"""
+
+class TruncatedStream:
+    """
+    File-like body that returns its data once, then fails like a dropped connection
+    """
+    def __init__(self, body, error):
+        self.body = body
+        self.error = error
+
+    def read(self, size=-1):
+        if self.body:
+            body, self.body = self.body, b''
+            return body
+        if self.error:
+            raise self.error
+        return b''
+
+class TruncatedResponse:
+    """
+    Stand-in for a streamed requests response whose body is cut short
+    """
+    status_code = 200
+
+    def __init__(self, body, error):
+        self.raw = TruncatedStream(body, error)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
 
 @pytest.fixture 
 def client():
@@ -56,7 +101,7 @@ def test_get_epoch_speed(client):
     X = float(first_response_data['X_DOT']['#text'])
     Y = float(first_response_data['Y_DOT']['#text'])
     Z = float(first_response_data['Z_DOT']['#text'])
-    first_speed = np.sqrt(np.square(X) + np.square(Y) + np.square(Z))
+    first_speed = hypot(X, Y, Z)
 
     speed_response = client.get(f'/epochs/{first_epoch}/speed')
     speed_data = speed_response.get_json()
@@ -123,3 +168,128 @@ def test_get_epoch_location(client):
 
     # Checks if epoch timestamp is a string
     assert isinstance(location_data['epoch_timestamp'], str)
+
+def test_missing_epoch(client):
+    """
+    Checks that unknown epochs return 404 from every per-epoch endpoint
+    """
+    missing_epoch = '1999-001T00:00:00.000Z'
+    first_epoch = client.get('/epochs?limit=1').get_json()[0]['epoch']
+
+    assert client.get(f'/epochs/{missing_epoch}').status_code == 404
+    assert client.get(f'/epochs/{missing_epoch}/speed').status_code == 404
+    assert client.get(f'/epochs/{missing_epoch}/location').status_code == 404
+
+    # internal keys sharing the Redis keyspace are not epochs either
+    for internal_key in ('iss:epochs', f"sv:{first_epoch}", f"loc:{first_epoch}"):
+        assert client.get(f'/epochs/{internal_key}').status_code == 404
+
+def test_epoch_timestamps():
+    """
+    Checks the vectorized epoch parser against the strptime-based one
+    """
+    epochs = [
+        '2025-061T12:00:00.000Z',
+        '2024-366T23:59:59.999Z',
+        '2024-060T00:00:00.000Z',
+        '1999-001T00:00:00.000Z',
+        '2038-019T03:14:08.500Z',
+        '2016-366T23:59:60.000Z',
+    ]
+    assert list(epoch_timestamps(epochs)) == [epoch_timestamp(epoch) for epoch in epochs]
+    assert len(epoch_timestamps([])) == 0
+
+    # malformed or out-of-range epochs are rejected instead of silently misparsed
+    for malformed in ('2025-061T12:00:00Z', '2025-061 12:00:00.000Z', '2025-06aT12:00:00.000Z',
+                      '2025-400T12:00:00.000Z', '2025-000T12:00:00.000Z', '2025-366T12:00:00.000Z',
+                      '2025-061T24:00:00.000Z', '2025-061T12:60:00.000Z', '2025-061T12:00:61.000Z',
+                      '2025-000T99:99:99.000Z'):
+        with pytest.raises(ValueError):
+            epoch_timestamps(['2025-061T12:00:00.000Z', malformed])
+
+def test_calculate_earth_coordinates():
+    """
+    Checks the ERFA conversion against reference values from astropy's GCRS->ITRS transform
+
+    The ERFA path approximates UT1 by UTC and ignores polar motion, which keeps it
+    within about 1e-4 degrees and a few metres of astropy; the tolerances allow for that.
+    """
+    lat, lon, alt = calculate_earth_coordinates('2025-061T12:00:00.000Z', [-4000.0, 3000.0, 4500.0])
+
+    assert lat == pytest.approx(42.05753082, abs=5e-4)
+    assert lon == pytest.approx(162.99838345, abs=5e-4)
+    assert alt == pytest.approx(358.22856551, abs=0.01)
+
+@pytest.mark.parametrize('error', [None, urllib3.exceptions.ProtocolError('Connection broken')])
+def test_fetch_truncated_stream(client, monkeypatch, error):
+    """
+    Checks that a body cut off mid-document fails the ingest without touching the live index
+    """
+    epoch_count = database.zcard(EPOCH_INDEX_KEY)
+    monkeypatch.setattr(iss_tracker.requests, 'get',
+                        lambda *args, **kwargs: TruncatedResponse(TRUNCATED_OEM, error))
+
+    assert fetch_orbital_data() is False
+    assert database.zcard(EPOCH_INDEX_KEY) == epoch_count
+    assert not database.exists(EPOCH_INDEX_STAGING_KEY)
+
+def test_fetch_removes_stale_epochs(client):
+    """
+    Checks that re-ingesting deletes epochs no longer published and bare keys from older layouts
+    """
+    stale_epoch = '1999-001T00:00:00.000Z'
+    stale_keys = [f'epoch:{stale_epoch}', f'sv:{stale_epoch}', f'loc:{stale_epoch}']
+    for key in stale_keys:
+        database.set(key, '{}')
+    database.zadd(EPOCH_INDEX_KEY, {stale_epoch: 915148800})
+
+    # a state vector left under a bare key by a pre-versioned ingest
+    database.set(stale_epoch, '{}')
+    database.delete(DATA_FORMAT_KEY)
+
+    assert fetch_orbital_data()
+    assert database.zscore(EPOCH_INDEX_KEY, stale_epoch) is None
+    assert not database.exists(*stale_keys, stale_epoch)
+    assert client.get(f'/epochs/{stale_epoch}').status_code == 404
+
+def test_ensure_orbital_data_lock(client, monkeypatch):
+    """
+    Checks that only the lock holder ingests, and that the lock is released on success
+    """
+    database.delete(DATA_FORMAT_KEY)
+    calls = []
+    monkeypatch.setattr(iss_tracker, 'fetch_orbital_data', lambda: calls.append(1) or True)
+
+    # another process holds the lock: no ingest here
+    database.set(INGEST_LOCK_KEY, '1')
+    assert ensure_orbital_data() is False
+    assert calls == []
+
+    database.delete(INGEST_LOCK_KEY)
+    assert ensure_orbital_data() is True
+    assert calls == [1]
+    assert not database.exists(INGEST_LOCK_KEY)
+
+def test_ensure_orbital_data_failure_keeps_lock(client, monkeypatch):
+    """
+    Checks that a failing ingest is logged and leaves the lock to expire
+    """
+    database.delete(DATA_FORMAT_KEY, INGEST_LOCK_KEY)
+
+    def failing_fetch():
+        raise RuntimeError('ingest failed')
+    monkeypatch.setattr(iss_tracker, 'fetch_orbital_data', failing_fetch)
+
+    assert ensure_orbital_data() is False
+    assert database.ttl(INGEST_LOCK_KEY) > 0
+
+def test_retry_orbital_data_ingest(monkeypatch):
+    """
+    Checks that the background retry keeps calling ensure_orbital_data until data is available
+    """
+    results = [False, False, True]
+    monkeypatch.setattr(iss_tracker, 'ensure_orbital_data', lambda: results.pop(0))
+    monkeypatch.setattr(iss_tracker.time, 'sleep', lambda seconds: None)
+
+    retry_orbital_data_ingest()
+    assert results == []